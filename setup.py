@@ -1,11 +1,15 @@
-import re
+import importlib.util
 import os
 from setuptools import setup
 
 
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
-with open(os.path.join(__location__, 'tableprint/metadata.py'), 'r') as f:
-    metadata = dict(re.findall("__([a-z_]+)__\s*=\s*'([^']+)'", f.read()))
+spec = importlib.util.spec_from_file_location(
+    'metadata', os.path.join(__location__, 'tableprint/metadata.py'))
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+metadata = {key.strip('_'): value for key, value in vars(module).items()
+            if key.startswith('__') and isinstance(value, str)}
 
 
 setup(
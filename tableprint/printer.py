@@ -9,20 +9,23 @@ Usage
 >>> headers = ['Column A', 'Column B', 'Column C']
 >>> tableprint.table(data, headers)
 """
-from itertools import chain, starmap
+from functools import lru_cache, partial
+from itertools import islice
 from numbers import Number
 import sys
 
 from .style import LineStyle, STYLES
-from .utils import ansi_len, format_line, parse_width, max_width
+from .utils import (NUMBER_TYPES, ansi_len, calculate_widths, format_line,
+                    is_plain, parse_width, max_width)
 
-__all__ = ('table', 'header', 'row', 'hrule', 'top',
+__all__ = ('table', 'header', 'row', 'make_row_formatter', 'hrule', 'top',
            'bottom', 'banner', 'dataframe', 'TableContext')
 
 # Defaults
 STYLE = 'round'
 FMT = '5g'
 ALIGN = 'right'
+BATCH_SIZE = 1000
 ALIGNMENTS = {"left": "<", "right": ">", "center": "^"}
 
 
@@ -34,7 +37,8 @@ class TableContext:
         align=ALIGN,
         style=STYLE,
         add_hr=True,
-        out=sys.stdout
+        out=sys.stdout,
+        flush_every=None
     ):
         """Context manager for table printing
 
@@ -62,6 +66,13 @@ class TableContext:
             write() method that takes a string argument, and a flush() method.
             See sys.stdout for an example. (Default: 'sys.stdout')
 
+        flush_every: int or None, optional
+            Flush the output after this many rows. If None, the output is
+            only flushed after the header and when the table is closed,
+            leaving it to the writer's own buffering in between; set this to
+            1 to see each row immediately on a block-buffered writer (e.g.
+            when stdout is piped). (Default: None)
+
         Usage
         -----
         >>> with TableContext("ABC") as t:
@@ -69,13 +80,45 @@ class TableContext:
                     t.row(np.random.randn(3))
         """
         self.out = out
+        style = _resolve_style(style)
         self.config = {'width': width, 'style': style, 'align': align}
         self.headers = header(headers, add_hr=add_hr, **self.config)
         self.bottom = bottom(len(headers), width=width, style=style)
+        self._format_row = make_row_formatter(len(headers), **self.config)
+        self.flush_every = flush_every
+        self._unflushed = 0
 
     def __call__(self, data):
-        self.out.write(row(data, **self.config) + '\n')
+        self.out.write(self._format_row(data) + '\n')
+        if self.flush_every is not None:
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every:
+                self.out.flush()
+                self._unflushed = 0
+
+    def rows(self, data, batch_size=256):
+        """Prints many rows of data at once
+
+        Rows are formatted and written in batches, with a single write()
+        call per batch and a single flush at the end, which is faster than
+        calling the context once per row.
+
+        Parameters
+        ----------
+        data: iterable
+            An iterable of rows, each an iterable of N values
+
+        batch_size: int, optional
+            The number of rows to write at a time, at least 1 (Default: 256)
+        """
+        if batch_size < 1:
+            raise ValueError(
+                'batch_size must be at least 1. Found: {}'.format(batch_size)
+            )
+
+        _write_lines(self.out, map(self._format_row, data), batch_size)
         self.out.flush()
+        self._unflushed = 0
 
     def __enter__(self):
         self.out.write(self.headers + '\n')
@@ -85,6 +128,7 @@ class TableContext:
     def __exit__(self, *exc):
         self.out.write(self.bottom + '\n')
         self.out.flush()
+        self._unflushed = 0
 
 
 def table(
@@ -94,7 +138,8 @@ def table(
     width=None,
     align=ALIGN,
     style=STYLE,
-    out=sys.stdout
+    out=sys.stdout,
+    flush=True
 ):
     """Print a table with the given data
 
@@ -110,10 +155,11 @@ def table(
     format_spec: string, optional
         Format specification for formatting numbers (Default: '5g')
 
-    width: int or None or array_like, optional
+    width: int or None or 'auto' or array_like, optional
         The width of each column in the table. If None, tries to estimate an
-        appropriate width based on the length of the data in the table.
-        (Default: None)
+        appropriate width based on the length of the data in the table. If
+        'auto', each column is sized separately to fit its header and data
+        (see `calculate_widths`). (Default: None)
 
     align: string, optional
         The alignment to use ('left', 'center', or 'right'). (Default: 'right')
@@ -125,32 +171,83 @@ def table(
         File handle or object used to manage IO (displaying the table). Must
         have a write() method that takes a string argument, and a flush()
         method. See sys.stdout for an example. (Default: 'sys.stdout')
+
+    flush: boolean, optional
+        Whether to flush the output once the table has been written
+        (Default: True)
     """
+    assert isinstance(format_spec, (str, list)), \
+        "format_spec must be a string or list of strings"
+
+    # unbox numpy arrays in a single call rather than element by element
+    values = data.tolist() if hasattr(data, 'tolist') else data
+
     # Auto-width.
-    if width is None:
-        max_header_width = 0 if headers is None else max_width(headers, FMT)
-        max_data_width = max_width(chain(*data), format_spec)
-        width = max(max_header_width, max_data_width)
+    if isinstance(width, str) and width == 'auto':
+        width = calculate_widths(values, format_spec, headers)
+    elif width is None:
+        width = max(calculate_widths(values, format_spec, headers))
 
     # Number of columns in the table.
     ncols = len(data[0]) if headers is None else len(headers)
-    tablestyle = STYLES[style]
+    tablestyle = _resolve_style(style)
     widths = parse_width(width, ncols)
 
-    # Initialize with a hr or the header
-    tablestr = [hrule(ncols, widths, tablestyle.top)] if headers is None \
-        else [header(headers, width=widths, align=align, style=style)]
+    # the number formats are the same for every row, so build them once
+    if isinstance(format_spec, str):
+        format_spec = [format_spec] * ncols
+    num_fmts = _number_formatters(tuple(widths), tuple(format_spec), align)
+    alignment = ALIGNMENTS[align]
+
+    # the row borders and separator are the same for every row
+    begin, _, sep, end = tablestyle.row
+    join = sep.join
+
+    # every row needs exactly one value per column
+    if getattr(data, 'ndim', None) == 2:
+        assert data.shape[1] == ncols, "Widths and data do not match."
+    else:
+        assert all(len(r) == ncols for r in values if hasattr(r, '__len__')), \
+            "Widths and data do not match."
 
     # parse each row
-    tablestr += [row(d, widths, format_spec, align, style) for d in data]
+    formatters = _column_formatters(values[0] if len(values) else (),
+                                    widths, num_fmts, alignment)
+    lines = (f'{begin}{join([f(d) for f, d in zip(formatters, r)])}{end}'
+             for r in values)
+
+    # start with a hr or the header
+    if headers is None:
+        out.write(hrule(ncols, widths, tablestyle.top) + '\n')
+    else:
+        out.write(header(headers, width=widths, align=align,
+                         style=tablestyle) + '\n')
+
+    # write the rows in batches, so long tables are never held in memory
+    _write_lines(out, lines, BATCH_SIZE)
 
     # only add the final border if there was data in the table
     if len(data) > 0:
-        tablestr += [hrule(ncols, widths, tablestyle.bottom)]
+        out.write(hrule(ncols, widths, tablestyle.bottom) + '\n')
+
+    if flush:
+        out.flush()
 
-    # print the table
-    out.write('\n'.join(tablestr) + '\n')
-    out.flush()
+
+def _resolve_style(style):
+    """Returns the TableStyle for a style name, or the given TableStyle."""
+    return STYLES[style] if isinstance(style, str) else style
+
+
+def _write_lines(out, lines, batch_size):
+    """Writes an iterable of lines, batch_size lines per write() call."""
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            break
+        # the empty last line makes join add the trailing newline
+        batch.append('')
+        out.write('\n'.join(batch))
 
 
 def header(headers, width=None, align=ALIGN, style=STYLE, add_hr=True):
@@ -176,13 +273,12 @@ def header(headers, width=None, align=ALIGN, style=STYLE, add_hr=True):
     if width is None:
         width = max_width(headers, FMT)
 
-    tablestyle = STYLES[style]
+    tablestyle = _resolve_style(style)
     widths = parse_width(width, len(headers))
     alignment = ALIGNMENTS[align]
 
     # string formatter
-    data = map(lambda x: ('{:%s%d}' % (
-        alignment, x[0] + ansi_len(x[1]))).format(x[1]), zip(widths, headers))
+    data = [_pad(h, w + ansi_len(h), alignment) for w, h in zip(widths, headers)]
 
     # build the formatted str
     headerstr = format_line(data, tablestyle.row)
@@ -215,51 +311,176 @@ def row(values, width=None, format_spec=FMT, align=ALIGN, style=STYLE):
     align: string, optional
         The alignment to use ('left', 'center', or 'right'). (Default: 'right')
 
-    style: namedtuple, optional
-        A line formatting style
+    style: string or tuple, optional
+        A formatting style: the name of one of the STYLES, or a TableStyle
 
     Returns
     -------
     rowstr: string
         A string consisting of the full row of data to print
     """
+    # iterate over the values exactly once, as plain python objects
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    elif not hasattr(values, '__len__'):
+        values = list(values)
+
     if width is None:
         width = max_width(values, format_spec)
 
-    tablestyle = STYLES[style]
+    tablestyle = _resolve_style(style)
     widths = parse_width(width, len(values))
+    num_fmts = _number_formatters(tuple(widths), _spec_key(format_spec), align)
+    return _format_row(values, widths, num_fmts, ALIGNMENTS[align],
+                       tablestyle.row)
+
+
+def make_row_formatter(n, width=11, format_spec=FMT, align=ALIGN, style=STYLE):
+    """Returns a function that formats rows of data
+
+    This is equivalent to calling `row` with the same arguments, except that
+    the column widths, number formats and line style are resolved once, up
+    front. Useful when printing many rows of a table one at a time.
 
-    format_spec_is_valid_type = isinstance(format_spec, str) or \
-        isinstance(format_spec, list)
-    assert format_spec_is_valid_type, \
+    Parameters
+    ----------
+    n: int
+        The number of columns in each row
+
+    width: int or array_like, optional
+        The width of each column (Default: 11)
+
+    format_spec: string or list of strings, optional
+        The precision format string used to format numbers (Default: '5g')
+
+    align: string, optional
+        The alignment to use ('left', 'center', or 'right'). (Default: 'right')
+
+    style: string or tuple, optional
+        A formatting style (see STYLES)
+
+    Returns
+    -------
+    formatter: function
+        Takes an iterable of n values and returns the formatted row string
+
+    Usage
+    -----
+    >>> fmt = make_row_formatter(3, width=8)
+    >>> for k in range(10):
+            print(fmt(np.random.randn(3)))
+    """
+    assert isinstance(format_spec, (str, list)), \
         "format_spec must be a string or list of strings"
 
+    widths = tuple(parse_width(width, n))
+    num_fmts = _number_formatters(widths, _spec_key(format_spec), align)
+    alignment = ALIGNMENTS[align]
+    linestyle = _resolve_style(style).row
+
+    def formatter(values):
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        elif not hasattr(values, '__len__'):
+            values = list(values)
+        assert len(values) == n, "Widths and data do not match."
+        return _format_row(values, widths, num_fmts, alignment, linestyle)
+
+    return formatter
+
+
+def _spec_key(format_spec):
+    """Returns a hashable version of a format_spec."""
+    return format_spec if isinstance(format_spec, str) else tuple(format_spec)
+
+
+@lru_cache(maxsize=64)
+def _number_formatters(widths, format_spec, align):
+    """Builds (and memoizes) the function that formats numbers in each column.
+
+    Each is the bound format method of a template like '{:>11.5g}'.
+    """
     if isinstance(format_spec, str):
-        format_spec = [format_spec] * len(list(values))
-
-    # mapping function for string formatting
-    def mapdata(width, datum, prec):
-        """Formats an individual piece of data."""
-        if isinstance(datum, str):
-            return (
-                '{:%s%i}' % (ALIGNMENTS[align], width + ansi_len(datum))
-            ).format(datum)
-        elif isinstance(datum, Number):
-            return (
-                '{:%s%i.%s}' % (ALIGNMENTS[align], width, prec)
-            ).format(datum)
-        else:
-            raise ValueError(
-                'Elements in the values array must be '
-                'strings, ints, or floats. Found: '
-                '{}'.format(datum.__class__.__name__)
-            )
+        format_spec = [format_spec] * len(widths)
 
-    # string formatter
-    data = starmap(mapdata, zip(widths, values, format_spec))
+    alignment = ALIGNMENTS[align]
+    return tuple(('{:%s%i.%s}' % (alignment, width, prec)).format
+                 for width, prec in zip(widths, format_spec))
+
+
+# Cell formatting is string work, which is best left to str.format and
+# str.join: JIT compilers such as Numba do not speed it up (object mode) or
+# cannot compile it (nopython mode).
+def _format_row(values, widths, num_fmts, alignment, linestyle):
+    """Formats a row of data using precomputed per-column number formatters."""
+    parts = [_format_cell(width, datum, num_fmt, alignment)
+             for width, datum, num_fmt in zip(widths, values, num_fmts)]
+    return format_line(parts, linestyle)
+
+
+def _format_cell(width, datum, num_fmt, alignment):
+    """Formats an individual piece of data."""
+    # check the common concrete types before the (slower) abstract Number
+    kind = type(datum)
+    if kind in NUMBER_TYPES:
+        return num_fmt(datum)
+    elif kind is str or isinstance(datum, str):
+        if not is_plain(datum):
+            width += ansi_len(datum)
+        return _pad(datum, width, alignment)
+    elif isinstance(datum, Number):
+        return num_fmt(datum)
+    else:
+        raise ValueError(
+            'Elements in the values array must be '
+            'strings, ints, or floats. Found: '
+            '{}'.format(datum.__class__.__name__)
+        )
+
+
+def _pad(string, width, alignment):
+    """Pads a string with spaces to the given width.
+
+    Same result as format(string, alignment + str(width)), without parsing
+    a format spec.
+    """
+    if alignment == '>':
+        return string.rjust(width)
+    elif alignment == '<':
+        return string.ljust(width)
+
+    # centered, with any odd space on the right (matching str.format)
+    padding = width - len(string)
+    if padding <= 0:
+        return string
+    left = padding // 2
+    return ' ' * left + string + ' ' * (padding - left)
+
+
+def _column_formatters(sample, widths, num_fmts, alignment):
+    """Returns a formatting function for each column, specialized on the type
+    of the corresponding value in a sample row.
+
+    Numeric columns format values of exactly the sampled type directly,
+    skipping the type dispatch in `_format_cell`. Values of any other type
+    (and all non-numeric columns) go through `_format_cell`.
+    """
+    def generic(width, num_fmt):
+        return partial(_format_cell, width, num_fmt=num_fmt,
+                       alignment=alignment)
+
+    def numeric(width, num_fmt, kind):
+        def formatter(datum):
+            if type(datum) is kind:
+                return num_fmt(datum)
+            return _format_cell(width, datum, num_fmt, alignment)
+        return formatter
 
-    # build the row string
-    return format_line(data, tablestyle.row)
+    return [
+        numeric(width, num_fmt, type(datum))
+        if isinstance(datum, Number) else generic(width, num_fmt)
+        for width, num_fmt, datum in zip(widths, num_fmts, sample)
+    ]
 
 
 def hrule(n=1, width=11, linestyle=LineStyle('', '─', '─', '')):
@@ -282,21 +503,25 @@ def hrule(n=1, width=11, linestyle=LineStyle('', '─', '─', '')):
     rowstr : string
         A string consisting of the row border to print
     """
-    widths = parse_width(width, n)
-    hrstr = linestyle.sep.join(
-        [('{:%s^%i}' % (linestyle.hline, width)).format('')for width in widths]
-    )
+    return _hrule(tuple(parse_width(width, n)), linestyle)
+
+
+@lru_cache(maxsize=128)
+def _hrule(widths, linestyle):
+    """Builds (and memoizes) the border string for the given column widths."""
+    fill = linestyle.hline or ' '
+    hrstr = linestyle.sep.join([fill * width for width in widths])
     return linestyle.begin + hrstr + linestyle.end
 
 
 def top(n, width=11, style=STYLE):
     """Prints the top row of a table"""
-    return hrule(n, width, linestyle=STYLES[style].top)
+    return hrule(n, width, linestyle=_resolve_style(style).top)
 
 
 def bottom(n, width=11, style=STYLE):
     """Prints the top row of a table"""
-    return hrule(n, width, linestyle=STYLES[style].bottom)
+    return hrule(n, width, linestyle=_resolve_style(style).bottom)
 
 
 def banner(message, width=30, style='banner', out=sys.stdout):
@@ -329,4 +554,4 @@ def dataframe(df, **kwargs):
     df: DataFrame
         A pandas DataFrame with the table to print
     """
-    table(df.values, list(df.columns), **kwargs)
+    table(df.to_numpy(), list(df.columns), **kwargs)
@@ -1,13 +1,39 @@
 """Tableprint utilities."""
 
-from functools import reduce
+from functools import lru_cache
+from itertools import chain
 import math
 import re
 
 from numbers import Number
 from wcwidth import wcswidth
 
-__all__ = ('humantime',)
+__all__ = ('humantime', 'calculate_widths')
+
+# The most common numeric types, checked before falling back to Number.
+NUMBER_TYPES = frozenset((int, float))
+
+# ANSI escape sequences (e.g. colors), which take up no space when printed
+_ANSI_RE = re.compile(r'\x1b[^m]*m')
+
+# Matches printable ASCII strings, where every character is one column wide
+# (so ansi_len is 0). Callers on hot paths can test this before ansi_len.
+is_plain = re.compile(r'[ -~]*').fullmatch
+
+# (seconds, label) of the whole units that humantime splits off, largest first
+_UNITS = (
+    (7 * 60 * 60 * 24, 'weeks'),
+    (60 * 60 * 24, 'days'),
+    (60 * 60, 'hours'),
+    (60, 'min.'),
+)
+
+# (seconds, scale, label) of the units used for the remaining time
+_SUBUNITS = (
+    (1, 1, 's'),
+    (1e-3, 1e3, 'ms'),
+    (1e-6, 1e6, '\u03BCs'),
+)
 
 
 def humantime(time):
@@ -31,54 +57,46 @@ def humantime(time):
             '{}'.format(time.__class__.__name__)
         )
 
-    # weeks
-    if time >= 7 * 60 * 60 * 24:
-        weeks = math.floor(time / (7 * 60 * 60 * 24))
-        timestr = "{:g} weeks, ".format(
-            weeks) + humantime(time % (7 * 60 * 60 * 24))
-
-    # days
-    elif time >= 60 * 60 * 24:
-        days = math.floor(time / (60 * 60 * 24))
-        timestr = "{:g} days, ".format(days) + humantime(time % (60 * 60 * 24))
-
-    # hours
-    elif time >= 60 * 60:
-        hours = math.floor(time / (60 * 60))
-        timestr = "{:g} hours, ".format(hours) + humantime(time % (60 * 60))
-
-    # minutes
-    elif time >= 60:
-        minutes = math.floor(time / 60.)
-        timestr = "{:g} min., ".format(minutes) + humantime(time % 60)
-
-    # seconds
-    elif (time >= 1) | (time == 0):
-        timestr = "{:g} s".format(time)
-
-    # milliseconds
-    elif time >= 1e-3:
-        timestr = "{:g} ms".format(time * 1e3)
-
-    # microseconds
-    elif time >= 1e-6:
-        timestr = "{:g} \u03BCs".format(time * 1e6)
-
-    # nanoseconds or smaller
+    # Plain Python on purpose: a handful of comparisons and a string result
+    # would not repay the compile time of a JIT such as Numba.
+    parts = []
+    for seconds, label in _UNITS:
+        if time >= seconds:
+            parts.append(f'{math.floor(time / seconds):g} {label}')
+            time %= seconds
+
+    # whatever is left is shown in the largest unit that fits
+    if time == 0:
+        parts.append('0 s')
     else:
-        timestr = "{:g} ns".format(time * 1e9)
+        for seconds, scale, label in _SUBUNITS:
+            if time >= seconds:
+                parts.append(f'{time * scale:g} {label}')
+                break
+        else:
+            parts.append(f'{time * 1e9:g} ns')
 
-    return timestr
+    return ', '.join(parts)
 
 
 def ansi_len(string):
     """Extra length due to any ANSI sequences in the string."""
-    return len(string) - wcswidth(re.compile(r'\x1b[^m]*m').sub('', string))
+    if is_plain(string):
+        return 0
+    if '\x1b' in string:
+        return len(string) - _wcswidth(_ANSI_RE.sub('', string))
+    return len(string) - _wcswidth(string)
+
+
+@lru_cache(maxsize=4096)
+def _wcswidth(string):
+    """Memoized wcswidth, since the same cell strings are measured often."""
+    return wcswidth(string)
 
 
 def format_line(data, linestyle):
     """Formats a list of elements using the given line style"""
-    return linestyle.begin + linestyle.sep.join(data) + linestyle.end
+    return f'{linestyle.begin}{linestyle.sep.join(data)}{linestyle.end}'
 
 
 def parse_width(width, n):
@@ -101,18 +119,65 @@ def parse_width(width, n):
 
 def max_width(data, format_spec):
     """Computes the maximum formatted width of an iterable of data."""
+    num_fmt = '{:0.%s}' % format_spec
+    return max([_formatted_width(d, num_fmt) for d in data])
 
-    def compute_width(d):
-        """Computes the formatted width of single element."""
-        if isinstance(d, str):
-            return len(d)
-        elif isinstance(d, Number):
-            return len(('{:0.%s}' % format_spec).format(d))
-        else:
-            raise ValueError(
-                'Elements in the values array must be '
-                'strings, ints, or floats. Found: '
-                '{}'.format(d.__class__.__name__)
-            )
 
-    return reduce(max, map(compute_width, data))
+def calculate_widths(data, format_spec, headers=None):
+    """Computes the minimum width of each column needed to fit the data
+
+    Parameters
+    ----------
+    data : array_like
+        An (m x n) array containing the table data (m rows of n columns)
+
+    format_spec : string or list of strings
+        The format specification used for numbers, for all columns or for
+        each column
+
+    headers : list of strings, optional
+        The column headers, which also need to fit in each column
+
+    Returns
+    -------
+    widths : list of int
+        The width of each of the n columns
+    """
+    rows = iter(data)
+    if headers is None:
+        first = next(rows, ())
+        widths = [0] * len(first)
+        rows = chain([first], rows)
+    else:
+        widths = [len(h) for h in headers]
+
+    if isinstance(format_spec, str):
+        format_spec = [format_spec] * len(widths)
+    num_fmts = ['{:0.%s}' % spec for spec in format_spec]
+
+    for row in rows:
+        for i, (d, num_fmt) in enumerate(zip(row, num_fmts)):
+            width = _formatted_width(d, num_fmt)
+            if width > widths[i]:
+                widths[i] = width
+
+    return widths
+
+
+def _formatted_width(d, num_fmt):
+    """Computes the formatted width of single element."""
+    kind = type(d)
+    if kind is str:
+        return len(d)
+    elif kind in NUMBER_TYPES:
+        return len(num_fmt.format(d))
+    elif isinstance(d, str):
+        return len(d)
+    elif isinstance(d, Number):
+        return len(num_fmt.format(d))
+    else:
+        raise ValueError(
+            'Elements in the values array must be '
+            'strings, ints, or floats. Found: '
+            '{}'.format(d.__class__.__name__)
+        )
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from tableprint import top, bottom, row
+from tableprint import top, bottom, row, make_row_formatter, STYLES
+import subprocess
+import sys
 import pytest
 
 
@@ -15,6 +17,9 @@ def test_borders():
     assert bottom(3, width=1, style='fancy_grid') == '╘═╧═╧═╛'
     assert bottom(3, 4, style='clean') == ' ──── ──── ──── '
 
+    # a TableStyle instead of a style name
+    assert top(1, width=6, style=STYLES['grid']) == '+------+'
+
 
 def test_row():
     """Tests printing of a single row of data."""
@@ -22,7 +27,26 @@ def test_row():
     # valid
     assert row("abc", width=3, style='round') == '│   a │   b │   c │'
     assert row([1, 2, 3], width=3, style='clean') == '   1   2   3 '
+    assert row([1.23456, 2.5], width=7, format_spec=['2f', '1e'],
+               style='grid') == '|   1.23|2.5e+00|'
+    assert row((x for x in [1, 2]), width=3, style='clean') == '   1   2 '
 
     # invalid
     with pytest.raises(ValueError):
         row([{}])
+
+
+def test_make_row_formatter():
+    """Tests that a row formatter matches the row function."""
+    fmt = make_row_formatter(3, width=5, format_spec='2f', style='grid')
+    for values in ([1, 2, 3], ['a', 0.5, 'bc']):
+        assert fmt(values) == row(values, width=5, format_spec='2f',
+                                  style='grid')
+
+
+def test_no_numpy_import():
+    """Tests that importing tableprint does not import numpy or pandas."""
+    code = ("import sys, tableprint; "
+            "assert 'numpy' not in sys.modules; "
+            "assert 'pandas' not in sys.modules")
+    subprocess.check_call([sys.executable, '-c', code])
@@ -2,7 +2,9 @@
 from __future__ import unicode_literals
 from tableprint import table, banner, dataframe, hrule, TableContext
 from io import StringIO
+import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_context():
@@ -14,6 +16,55 @@ def test_context():
     assert output.getvalue() == '╭───────┬───────┬───────╮\n│     A │     B │     C │\n├───────┼───────┼───────┤\n│     1 │     2 │     3 │\n│     4 │     5 │     6 │\n╰───────┴───────┴───────╯\n'  # noqa
 
 
+def test_context_rows():
+    """Tests writing many rows at once with the table context manager"""
+    expected = StringIO()
+    with TableContext('ABC', width=5, out=expected) as t:
+        for k in range(5):
+            t([k, 'x', k / 2])
+
+    output = StringIO()
+    with TableContext('ABC', width=5, out=output) as t:
+        t.rows(([k, 'x', k / 2] for k in range(5)), batch_size=2)
+    assert output.getvalue() == expected.getvalue()
+
+    with TableContext('ABC', width=5, out=StringIO()) as t:
+        with pytest.raises(ValueError):
+            t.rows([[1, 2, 3]], batch_size=0)
+
+
+def test_context_mismatch():
+    """Tests that rows with the wrong number of values raise an error"""
+    with TableContext('ABC', width=[3, 3, 3], out=StringIO()) as t:
+        for values in ([1, 2, 3, 4], [1, 2], (x for x in [1, 2])):
+            with pytest.raises(AssertionError):
+                t(values)
+
+
+def test_context_flush():
+    """Tests that the table context only flushes every few rows"""
+    class Output(StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+
+    output = Output()
+    with TableContext('ABC', width=5, out=output, flush_every=3) as t:
+        assert output.flushes == 1
+        for k in range(7):
+            t([k, k, k])
+        assert output.flushes == 3
+    assert output.flushes == 4
+
+    output = Output()
+    with TableContext('ABC', width=5, out=output) as t:
+        for k in range(7):
+            t([k, k, k])
+        assert output.flushes == 1
+    assert output.flushes == 2
+
+
 def test_table():
     """Tests the table function"""
     output = StringIO()
@@ -24,6 +75,10 @@ def test_table():
     table(["bar"], "foo", style='grid', width=3, out=output)
     assert output.getvalue() == '+---+---+---+\n|  f|  o|  o|\n+---+---+---+\n|  b|  a|  r|\n+---+---+---+\n'  # noqa
 
+    output = StringIO()
+    table([[1, 'abc'], [20, 'd']], ['A', 'B'], style='grid', width='auto', out=output)
+    assert output.getvalue() == '+--+---+\n| A|  B|\n+--+---+\n| 1|abc|\n|20|  d|\n+--+---+\n'  # noqa
+
 
 def test_frame():
     """Tests the dataframe function"""
@@ -49,3 +104,27 @@ def test_hrule():
     output = hrule(1, width=11)
     assert len(output) == 11
     assert '───────────'
+
+
+def test_table_mismatch():
+    """Tests that rows with the wrong number of values raise an error"""
+    for data in ([[1, 2, 3, 4]], [[1, 2]], [[1, 2, 3], [4, 5]],
+                 np.ones((2, 4)), np.ones((2, 2))):
+        with pytest.raises(AssertionError):
+            table(data, 'ABC', width=5, out=StringIO())
+
+
+def test_table_ndarray():
+    """Tests printing a numeric numpy array"""
+    data = np.array([[1.5, -2.25, 3e6], [4, 5, 6]])
+    output = StringIO()
+    table(data, 'ABC', width=9, align='left', style='grid', out=output)
+    assert output.getvalue() == '+---------+---------+---------+\n|A        |B        |C        |\n+---------+---------+---------+\n|1.5      |-2.25    |3e+06    |\n|4        |5        |6        |\n+---------+---------+---------+\n'  # noqa
+
+    output = StringIO()
+    table(data, 'ABC', width=9, align='center', style='grid', out=output)
+    assert output.getvalue() == '+---------+---------+---------+\n|    A    |    B    |    C    |\n+---------+---------+---------+\n|   1.5   |  -2.25  |  3e+06  |\n|    4    |    5    |    6    |\n+---------+---------+---------+\n'  # noqa
+
+    output = StringIO()
+    table(data, 'ABC', width='auto', format_spec=['2f', '3e', '5g'], style='grid', out=output)
+    assert output.getvalue() == '+----+----------+-----+\n|   A|         B|    C|\n+----+----------+-----+\n|1.50|-2.250e+00|3e+06|\n|4.00| 5.000e+00|    6|\n+----+----------+-----+\n'  # noqa
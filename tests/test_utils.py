@@ -2,7 +2,7 @@
 from __future__ import unicode_literals
 import numpy as np
 from tableprint import humantime, LineStyle
-from tableprint.utils import format_line, max_width
+from tableprint.utils import ansi_len, calculate_widths, format_line, max_width
 import pytest
 
 
@@ -19,6 +19,22 @@ def test_max_width():
     assert max_width([np.pi, np.pi], '3f') == 5
 
 
+def test_calculate_widths():
+    """Tests the per-column auto width feature"""
+    data = [[1, 'abc', 2.5], [10, 'a', np.pi]]
+    assert calculate_widths(data, '3g') == [2, 3, 4]
+    assert calculate_widths(data, '3g', ['A', 'B', 'Column']) == [2, 3, 6]
+    assert calculate_widths(data, ['0f', '0f', '2f']) == [2, 3, 4]
+    assert calculate_widths([], '3g', ['A', 'Bee']) == [1, 3]
+
+
+def test_ansi_len():
+    """Tests the extra length from ANSI sequences and wide characters"""
+    assert ansi_len('abc') == 0
+    assert ansi_len('\x1b[31mabc\x1b[0m') == 9
+    assert ansi_len('\u4e2d\u6587') == -2
+
+
 def test_format_line():
     """Tests line formatting"""
 